@@ -1,22 +1,73 @@
 """CLI commands using Typer."""
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from . import github_api, local_git
+# Rich, requests and GitPython are imported inside the commands that use
+# them, so `devstats version` and `--help` start quickly
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="devstats",
     help="Developer statistics CLI - GitHub & local git analysis",
     add_completion=False,
 )
-console = Console()
+
+# Tables longer than this are printed as plain columns instead of Rich tables
+SIMPLE_TABLE_THRESHOLD = 50
+
+
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+def _status(message: str) -> AbstractContextManager:
+    """Show a spinner while working, but only on an interactive terminal."""
+    console = _get_console()
+    return console.status(message) if console.is_terminal else nullcontext()
+
+
+def _print_simple_table(
+    title: str,
+    headers: list[str],
+    rows: list[tuple[str, ...]],
+    styles: list[str],
+) -> None:
+    """Print rows as padded plain-text columns.
+
+    Rich tables measure every cell before rendering, which gets slow for
+    long listings; this only pads each cell to its column's widest value.
+    """
+    from rich.text import Text
+
+    widths = [
+        max([len(header), *(len(row[i]) for row in rows)])
+        for i, header in enumerate(headers)
+    ]
+
+    text = Text()
+    text.append(f"{title}\n", style="italic")
+    header_line = "  ".join(h.ljust(w) for h, w in zip(headers, widths))
+    text.append(header_line.rstrip(), style="bold")
+    for row in rows:
+        text.append("\n")
+        for i, (cell, width, style) in enumerate(zip(row, widths, styles)):
+            if i:
+                text.append("  ")
+            text.append(cell if i == len(row) - 1 else cell.ljust(width), style=style)
+
+    _get_console().print(text, no_wrap=True)
 
 
 @app.command()
@@ -35,12 +86,25 @@ def github(
         "-f",
         help="Include forked repositories",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the on-disk REST response cache (not used for GraphQL with a token)",
+    ),
 ):
     """Show GitHub profile and repository statistics."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    from . import github_api
+
+    console = _get_console()
     try:
-        with console.status(f"Fetching data for {username}..."):
-            user = github_api.get_user(username, token)
-            repos = github_api.get_user_repos(username, token, include_forks)
+        with _status(f"Fetching data for {username}..."):
+            user, repos = github_api.get_user_overview(
+                username, token, include_forks, use_cache=not no_cache
+            )
             summary = github_api.calculate_summary_stats(repos)
 
         # User profile panel
@@ -91,8 +155,7 @@ def github(
             repo_table.add_column("Forks", style="blue", justify="right")
             repo_table.add_column("Language", style="green")
 
-            sorted_repos = sorted(repos, key=lambda r: r.stars, reverse=True)[:10]
-            for repo in sorted_repos:
+            for repo in heapq.nlargest(10, repos, key=lambda r: r.stars):
                 repo_table.add_row(
                     repo.name,
                     str(repo.stars),
@@ -123,14 +186,35 @@ def local(
         "-c",
         help="Number of recent commits to show",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Recompute repository stats instead of using the cache",
+    ),
+    shallow: bool = typer.Option(
+        False,
+        "--shallow",
+        help="Only walk recent history (approximate stats, much faster on huge repos)",
+    ),
 ):
     """Analyze a local git repository."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    from . import local_git
+
+    console = _get_console()
     try:
-        with console.status(f"Analyzing repository..."):
-            stats = local_git.analyze_repo(path)
-            recent = local_git.get_recent_commits(path, commits)
-            frequency = local_git.get_commit_frequency(path)
-            file_types = local_git.get_file_types(path)
+        with _status("Analyzing repository..."):
+            # Open the repository once and share it across the analyses
+            repo = local_git.get_repo(path)
+            stats = local_git.analyze_repo(
+                path, use_cache=not no_cache, shallow=shallow, repo=repo
+            )
+            recent = local_git.get_recent_commits(path, commits, shallow=shallow, repo=repo)
+            frequency = local_git.get_commit_frequency(path, shallow=shallow, repo=repo)
+            file_types = local_git.get_file_types(path, repo=repo)
 
         # Repository info panel
         info_text = Text()
@@ -138,6 +222,8 @@ def local(
         info_text.append(f"Branch: {stats.current_branch}\n", style="cyan")
         info_text.append(f"Commits: {stats.total_commits:,}  ")
         info_text.append(f"Branches: {stats.total_branches}")
+        if shallow:
+            info_text.append(f"\n(last {local_git.SHALLOW_DAYS} days only)", style="dim")
 
         if stats.first_commit and stats.last_commit:
             info_text.append(f"\nFirst commit: {stats.first_commit.strftime('%Y-%m-%d')}")
@@ -194,7 +280,22 @@ def local(
             console.print(files_table)
 
         # Recent commits
-        if recent:
+        if len(recent) > SIMPLE_TABLE_THRESHOLD:
+            _print_simple_table(
+                f"Recent Commits ({len(recent)})",
+                ["SHA", "Message", "Author", "Changes"],
+                [
+                    (
+                        commit.sha,
+                        commit.message[:50],
+                        commit.author,
+                        f"+{commit.insertions}/-{commit.deletions}",
+                    )
+                    for commit in recent
+                ],
+                ["yellow", "white", "cyan", "dim"],
+            )
+        elif recent:
             commits_table = Table(title=f"Recent Commits ({len(recent)})")
             commits_table.add_column("SHA", style="yellow", width=7)
             commits_table.add_column("Message", style="white")
@@ -228,14 +329,31 @@ def compare(
         envvar="GITHUB_TOKEN",
         help="GitHub personal access token",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the on-disk REST response cache (not used for GraphQL with a token)",
+    ),
 ):
     """Compare two GitHub profiles."""
+    from rich.table import Table
+
+    from . import github_api
+
+    console = _get_console()
     try:
-        with console.status("Fetching data..."):
-            user1 = github_api.get_user(username1, token)
-            user2 = github_api.get_user(username2, token)
-            repos1 = github_api.get_user_repos(username1, token)
-            repos2 = github_api.get_user_repos(username2, token)
+        with _status("Fetching data..."):
+            use_cache = not no_cache
+            # Fetch both profiles at the same time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                overview1 = executor.submit(
+                    github_api.get_user_overview, username1, token, use_cache=use_cache
+                )
+                overview2 = executor.submit(
+                    github_api.get_user_overview, username2, token, use_cache=use_cache
+                )
+                user1, repos1 = overview1.result()
+                user2, repos2 = overview2.result()
             stats1 = github_api.calculate_summary_stats(repos1)
             stats2 = github_api.calculate_summary_stats(repos2)
 
@@ -276,7 +394,7 @@ def version():
     """Show version information."""
     from . import __version__
 
-    console.print(f"devstats version {__version__}")
+    typer.echo(f"devstats version {__version__}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,100 @@
 """GitHub API client for fetching user and repository statistics."""
 
+import json
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import __version__
+from .cache import cache_key, get_cache_dir, read_json, write_json
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 BASE_URL = "https://api.github.com"
+GRAPHQL_URL = f"{BASE_URL}/graphql"
 TIMEOUT = 10
+MAX_WORKERS = 8
+TOP_LANGUAGES = 20
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled keep-alive session shared by all API calls."""
+    session = requests.Session()
+    session.headers.update(
+        {
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "User-Agent": f"dev-stats-cli/{__version__}",
+        }
+    )
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry),
+    )
+    return session
+
+
+_SESSION = _create_session()
+_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+
+# Profile plus one page of owned public repositories, mirroring what the
+# REST users/{username} and users/{username}/repos endpoints return
+_USER_OVERVIEW_QUERY = """
+query($login: String!, $cursor: String, $isFork: Boolean) {
+  user(login: $login) {
+    login
+    name
+    bio
+    avatarUrl
+    createdAt
+    followers { totalCount }
+    following { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) {
+      totalCount
+    }
+    repositories(
+      first: 100
+      after: $cursor
+      privacy: PUBLIC
+      ownerAffiliations: OWNER
+      isFork: $isFork
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        description
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        createdAt
+        updatedAt
+        isFork
+        diskUsage
+      }
+    }
+  }
+}
+"""
 
 
 class GitHubError(Exception):
@@ -16,6 +103,13 @@ class GitHubError(Exception):
     pass
 
 
+class _NotFoundError(GitHubError):
+    """A GraphQL query did not resolve the requested object."""
+
+    def __init__(self) -> None:
+        super().__init__("Resource not found")
+
+
 @dataclass
 class UserStats:
     """GitHub user statistics."""
@@ -59,32 +153,202 @@ class ContributionStats:
     repos_contributed_to: int
 
 
-def _make_request(
+if sys.version_info >= (3, 11):
+
+    def _parse_gh_ts(value: str) -> datetime:
+        """Parse a GitHub timestamp such as 2024-01-01T00:00:00Z."""
+        return datetime.fromisoformat(value)
+
+else:
+
+    def _parse_gh_ts(value: str) -> datetime:
+        """Parse a GitHub timestamp such as 2024-01-01T00:00:00Z."""
+        # GitHub always sends UTC in this fixed layout, so slice it directly
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+
+
+def _cache_path(url: str, params: dict | None) -> Path:
+    """Get the cache file for a request."""
+    key = cache_key(url, json.dumps(params or {}, sort_keys=True))
+    return get_cache_dir("github") / f"{key}.json"
+
+
+def _cache_get(url: str, params: dict | None) -> dict | None:
+    """Look up a cached response body with its ETag and Link header."""
+    entry = read_json(_cache_path(url, params))
+    if not isinstance(entry, dict) or "etag" not in entry:
+        return None
+    return entry
+
+
+def _cache_put(url: str, params: dict | None, etag: str, body: Any, link: str) -> None:
+    """Store a response body with its ETag and Link header."""
+    write_json(
+        _cache_path(url, params),
+        {"etag": etag, "body": body, "link": link},
+    )
+
+
+def _get(
     endpoint: str,
     token: str | None = None,
     params: dict | None = None,
-) -> Any:
-    """Make a request to the GitHub API."""
+    use_cache: bool = True,
+) -> tuple[Any, str]:
+    """Send a GET request to the GitHub API.
+
+    Returns the decoded body and the raw Link header. Responses carrying an
+    ETag are cached on disk and revalidated with If-None-Match, so unchanged
+    resources come back as 304 Not Modified.
+    """
     url = f"{BASE_URL}/{endpoint}"
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    cached = _cache_get(url, params) if use_cache else None
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached["body"], cached.get("link", "")
         if response.status_code == 404:
             raise GitHubError("Resource not found")
         if response.status_code == 403:
             raise GitHubError("Rate limit exceeded or access denied")
         response.raise_for_status()
-        return response.json()
+        body = _loads(response.content)
+    except requests.RequestException as e:
+        raise GitHubError(f"API request failed: {e}") from e
+    except ValueError as e:
+        raise GitHubError(f"Invalid JSON in API response: {e}") from e
+
+    link = response.headers.get("Link", "")
+    etag = response.headers.get("ETag")
+    if use_cache and etag:
+        _cache_put(url, params, etag, body, link)
+    return body, link
+
+
+def _make_request(
+    endpoint: str,
+    token: str | None = None,
+    params: dict | None = None,
+    use_cache: bool = True,
+) -> Any:
+    """Make a request to the GitHub API."""
+    return _get(endpoint, token, params, use_cache)[0]
+
+
+def _last_page(link: str) -> int:
+    """Get the last page number from a paginated response's Link header."""
+    for entry in requests.utils.parse_header_links(link):
+        if entry.get("rel") == "last":
+            match = _PAGE_RE.search(entry["url"])
+            return int(match.group(1)) if match else 1
+    return 1
+
+
+def _graphql(query: str, variables: dict, token: str) -> dict:
+    """Run a GraphQL query against the GitHub API and return its data."""
+    try:
+        response = _SESSION.post(
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=TIMEOUT,
+        )
+        if response.status_code in (401, 403):
+            raise GitHubError("Rate limit exceeded or access denied")
+        response.raise_for_status()
+        payload = _loads(response.content)
     except requests.RequestException as e:
         raise GitHubError(f"API request failed: {e}") from e
+    except ValueError as e:
+        raise GitHubError(f"Invalid JSON in API response: {e}") from e
+
+    errors = payload.get("errors")
+    if errors:
+        if any(error.get("type") == "NOT_FOUND" for error in errors):
+            raise _NotFoundError()
+        raise GitHubError(f"API request failed: {errors[0].get('message')}")
+    return payload["data"]
+
+
+def _get_user_overview_graphql(
+    username: str,
+    token: str,
+    include_forks: bool,
+) -> tuple[UserStats, list[RepoStats]]:
+    """Get a user's profile and repositories through the GraphQL API."""
+    variables = {
+        "login": username,
+        "cursor": None,
+        "isFork": None if include_forks else False,
+    }
+    repos = []
+
+    while True:
+        user = _graphql(_USER_OVERVIEW_QUERY, variables, token)["user"]
+        if user is None:
+            raise _NotFoundError()
 
+        for node in user["repositories"]["nodes"]:
+            language = node["primaryLanguage"]
+            repos.append(
+                RepoStats(
+                    name=node["name"],
+                    full_name=node["nameWithOwner"],
+                    description=node["description"],
+                    language=language["name"] if language else None,
+                    stars=node["stargazerCount"],
+                    forks=node["forkCount"],
+                    # REST reports stargazers as watchers; keep the same meaning
+                    watchers=node["stargazerCount"],
+                    # REST open_issues_count includes open pull requests
+                    open_issues=(
+                        node["issues"]["totalCount"] + node["pullRequests"]["totalCount"]
+                    ),
+                    created_at=_parse_gh_ts(node["createdAt"]),
+                    updated_at=_parse_gh_ts(node["updatedAt"]),
+                    is_fork=node["isFork"],
+                    size_kb=node["diskUsage"] or 0,
+                )
+            )
 
-def get_user(username: str, token: str | None = None) -> UserStats:
+        page_info = user["repositories"]["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        variables["cursor"] = page_info["endCursor"]
+
+    stats = UserStats(
+        username=user["login"],
+        name=user["name"],
+        bio=user["bio"],
+        public_repos=user["publicRepos"]["totalCount"],
+        followers=user["followers"]["totalCount"],
+        following=user["following"]["totalCount"],
+        created_at=_parse_gh_ts(user["createdAt"]),
+        avatar_url=user["avatarUrl"],
+    )
+    return stats, repos
+
+
+def get_user(
+    username: str,
+    token: str | None = None,
+    use_cache: bool = True,
+) -> UserStats:
     """Get user profile information."""
-    data = _make_request(f"users/{username}", token)
+    data = _make_request(f"users/{username}", token, use_cache=use_cache)
     return UserStats(
         username=data["login"],
         name=data.get("name"),
@@ -92,7 +356,7 @@ def get_user(username: str, token: str | None = None) -> UserStats:
         public_repos=data["public_repos"],
         followers=data["followers"],
         following=data["following"],
-        created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
+        created_at=_parse_gh_ts(data["created_at"]),
         avatar_url=data.get("avatar_url"),
     )
 
@@ -101,75 +365,112 @@ def get_user_repos(
     username: str,
     token: str | None = None,
     include_forks: bool = False,
+    use_cache: bool = True,
 ) -> list[RepoStats]:
     """Get user's repositories."""
-    repos = []
-    page = 1
-    per_page = 100
-
-    while True:
-        data = _make_request(
-            f"users/{username}/repos",
-            token,
-            params={"page": page, "per_page": per_page, "sort": "updated"},
-        )
+    endpoint = f"users/{username}/repos"
 
-        if not data:
-            break
+    def page_params(page: int) -> dict:
+        return {"page": page, "per_page": 100, "sort": "updated"}
 
-        for repo in data:
-            if not include_forks and repo["fork"]:
-                continue
+    # The first page tells us how many pages there are; fetch the rest concurrently
+    data, link = _get(endpoint, token, page_params(1), use_cache)
+    last_page = _last_page(link)
 
-            repos.append(
-                RepoStats(
-                    name=repo["name"],
-                    full_name=repo["full_name"],
-                    description=repo.get("description"),
-                    language=repo.get("language"),
-                    stars=repo["stargazers_count"],
-                    forks=repo["forks_count"],
-                    watchers=repo["watchers_count"],
-                    open_issues=repo["open_issues_count"],
-                    created_at=datetime.fromisoformat(
-                        repo["created_at"].replace("Z", "+00:00")
-                    ),
-                    updated_at=datetime.fromisoformat(
-                        repo["updated_at"].replace("Z", "+00:00")
-                    ),
-                    is_fork=repo["fork"],
-                    size_kb=repo["size"],
-                )
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pages = executor.map(
+                lambda page: _make_request(endpoint, token, page_params(page), use_cache),
+                range(2, last_page + 1),
             )
+            for page_data in pages:
+                data.extend(page_data)
 
-        if len(data) < per_page:
-            break
-        page += 1
+    repos = []
+    for repo in data:
+        if not include_forks and repo["fork"]:
+            continue
+
+        repos.append(
+            RepoStats(
+                name=repo["name"],
+                full_name=repo["full_name"],
+                description=repo.get("description"),
+                language=repo.get("language"),
+                stars=repo["stargazers_count"],
+                forks=repo["forks_count"],
+                watchers=repo["watchers_count"],
+                open_issues=repo["open_issues_count"],
+                created_at=_parse_gh_ts(repo["created_at"]),
+                updated_at=_parse_gh_ts(repo["updated_at"]),
+                is_fork=repo["fork"],
+                size_kb=repo["size"],
+            )
+        )
 
     return repos
 
 
-def get_repo_languages(owner: str, repo: str, token: str | None = None) -> dict[str, int]:
+def get_user_overview(
+    username: str,
+    token: str | None = None,
+    include_forks: bool = False,
+    use_cache: bool = True,
+) -> tuple[UserStats, list[RepoStats]]:
+    """Get a user's profile together with their repositories.
+
+    With a token this is a single GraphQL query per 100 repositories. The
+    GraphQL API requires authentication, so without one the REST endpoints
+    are queried concurrently instead. Organizations are not GraphQL users
+    and are always fetched through REST.
+
+    Only REST requests are cached: ``use_cache`` has no effect on the
+    GraphQL query, which is never cached.
+    """
+    if token:
+        try:
+            return _get_user_overview_graphql(username, token, include_forks)
+        except _NotFoundError:
+            # GraphQL user() does not resolve organizations, but the REST
+            # users/ endpoints do; a login that truly does not exist fails
+            # there with the same "Resource not found" error
+            pass
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        user_future = executor.submit(get_user, username, token, use_cache)
+        repos = get_user_repos(username, token, include_forks, use_cache)
+        return user_future.result(), repos
+
+
+def get_repo_languages(
+    owner: str,
+    repo: str,
+    token: str | None = None,
+    use_cache: bool = True,
+) -> dict[str, int]:
     """Get language breakdown for a repository."""
-    return _make_request(f"repos/{owner}/{repo}/languages", token)
+    return _make_request(f"repos/{owner}/{repo}/languages", token, use_cache=use_cache)
 
 
 def calculate_language_stats(repos: list[RepoStats]) -> dict[str, int]:
-    """Calculate language usage across repositories."""
-    languages: dict[str, int] = {}
-    for repo in repos:
-        if repo.language:
-            languages[repo.language] = languages.get(repo.language, 0) + 1
-    return dict(sorted(languages.items(), key=lambda x: x[1], reverse=True))
+    """Calculate usage of the most common languages across repositories."""
+    languages = Counter(repo.language for repo in repos if repo.language)
+    return dict(languages.most_common(TOP_LANGUAGES))
 
 
 def calculate_summary_stats(repos: list[RepoStats]) -> dict[str, Any]:
     """Calculate summary statistics from repositories."""
-    total_stars = sum(r.stars for r in repos)
-    total_forks = sum(r.forks for r in repos)
-    total_size = sum(r.size_kb for r in repos)
+    # Transpose the hot fields into columns so each reduction runs in C
+    # (sum/Counter) instead of a Python-level loop over RepoStats objects
+    columns = zip(*map(attrgetter("stars", "forks", "size_kb", "language"), repos))
+    stars, forks, sizes, repo_languages = tuple(columns) or ((), (), (), ())
+
+    total_stars = sum(stars)
+    total_forks = sum(forks)
+    total_size = sum(sizes)
+    language_counts = Counter(filter(None, repo_languages))
+    languages = dict(language_counts.most_common(TOP_LANGUAGES))
 
-    languages = calculate_language_stats(repos)
     top_language = list(languages.keys())[0] if languages else None
 
     return {
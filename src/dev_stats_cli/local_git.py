@@ -1,13 +1,28 @@
 """Local git repository analysis."""
 
 from collections import Counter
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
 from pathlib import Path
 
 from git import InvalidGitRepositoryError, Repo
 from git.exc import GitCommandError
 
+from .cache import cache_key, get_cache_dir, read_json, write_json
+
+
+# Number of most recent commits whose line changes analyze_repo adds up
+STATS_SAMPLE_SIZE = 100
+
+# Window used by shallow analysis of very large histories
+SHALLOW_DAYS = 60
+
+_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Record/unit separators keep the log output unambiguous for any commit message
+_NUMSTAT_FORMAT = "format:%x1e%H%x1f%an%x1f%ae%x1f%cI%x1f%s"
+
 
 class LocalGitError(Exception):
     """Exception raised for local git errors."""
@@ -53,9 +68,142 @@ def get_repo(path: str | Path) -> Repo:
         raise LocalGitError(f"Not a git repository: {path}") from e
 
 
-def analyze_repo(path: str | Path) -> LocalRepoStats:
-    """Analyze a local git repository."""
-    repo = get_repo(path)
+def _iter_git_lines(repo: Repo, command: str, *args: str) -> Iterator[str]:
+    """Stream the output of a git command line by line."""
+    proc = getattr(repo.git, command)(*args, as_process=True)
+    for line in proc.stdout:
+        yield line.decode("utf-8", errors="replace").rstrip("\n")
+    proc.wait()
+
+
+def _iter_git_records(repo: Repo, command: str, *args: str) -> Iterator[str]:
+    """Stream the NUL-terminated records of a git command run with -z."""
+    proc = getattr(repo.git, command)(*args, as_process=True)
+    pending = b""
+    while chunk := proc.stdout.read(65536):
+        *records, pending = (pending + chunk).split(b"\0")
+        for record in records:
+            yield record.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+    proc.wait()
+
+
+def _since_args(shallow: bool) -> tuple[str, ...]:
+    """Extra git log arguments limiting the walk for shallow analysis."""
+    return (f"--since={SHALLOW_DAYS}.days.ago",) if shallow else ()
+
+
+def _bulk_numstat(repo: Repo, count: int, shallow: bool = False) -> list[CommitInfo]:
+    """Get recent commits with their line stats from a single git log call."""
+    if not repo.head.is_valid():
+        return []
+
+    # -m prints a merge once per parent, first parent first; unlike
+    # --diff-merges=first-parent it works on git older than 2.31.
+    # --no-renames matches commit.stats and ignores the diff.renames setting
+    output = repo.git.log(
+        f"-n{count}",
+        "--numstat",
+        "--no-renames",
+        "-m",
+        f"--pretty={_NUMSTAT_FORMAT}",
+        *_since_args(shallow),
+    )
+
+    commits = []
+    seen: set[str] = set()
+    for record in output.split("\x1e")[1:]:
+        header, _, numstat = record.partition("\n")
+        sha, author, email, date, subject = header.split("\x1f", 4)
+
+        # Keep only a merge's diff against its first parent
+        if sha in seen:
+            continue
+        seen.add(sha)
+
+        files_changed = insertions = deletions = 0
+        for line in numstat.splitlines():
+            if not line:
+                continue
+            added, deleted, _ = line.split("\t", 2)
+            files_changed += 1
+            # Binary files are reported as "-"
+            if added != "-":
+                insertions += int(added)
+            if deleted != "-":
+                deletions += int(deleted)
+
+        commits.append(
+            CommitInfo(
+                sha=sha[:7],
+                message=subject[:72],
+                author=author,
+                author_email=email,
+                date=datetime.fromisoformat(date),
+                files_changed=files_changed,
+                insertions=insertions,
+                deletions=deletions,
+            )
+        )
+
+    return commits
+
+
+def _stats_cache_file(path: Path) -> Path:
+    """Get the cache file for a repository's stats."""
+    return get_cache_dir("local") / f"{cache_key(str(path))}.json"
+
+
+def _optional_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 string, passing None through."""
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _load_cached_stats(path: Path, tip: str) -> LocalRepoStats | None:
+    """Load cached stats if they were computed at the same HEAD commit."""
+    entry = read_json(_stats_cache_file(path))
+    if not isinstance(entry, dict) or entry.get("tip") != tip:
+        return None
+
+    try:
+        data = entry["stats"]
+        return LocalRepoStats(
+            **{
+                **data,
+                "contributors": [tuple(c) for c in data["contributors"]],
+                "first_commit": _optional_datetime(data["first_commit"]),
+                "last_commit": _optional_datetime(data["last_commit"]),
+            }
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _save_cached_stats(path: Path, tip: str, stats: LocalRepoStats) -> None:
+    """Cache stats keyed by the HEAD commit they were computed at."""
+    data = asdict(stats)
+    for field in ("first_commit", "last_commit"):
+        if data[field] is not None:
+            data[field] = data[field].isoformat()
+    write_json(_stats_cache_file(path), {"tip": tip, "stats": data})
+
+
+def analyze_repo(
+    path: str | Path,
+    use_cache: bool = True,
+    shallow: bool = False,
+    repo: Repo | None = None,
+) -> LocalRepoStats:
+    """Analyze a local git repository.
+
+    Results are cached per repository and reused while HEAD is unchanged.
+    With ``shallow``, only the last SHALLOW_DAYS of history are walked, which
+    gives approximate stats but is far faster on huge repositories. Shallow
+    results depend on the current date, so they are never cached.
+    """
+    if repo is None:
+        repo = get_repo(path)
     path = Path(path).resolve()
 
     # Get branch info
@@ -66,38 +214,51 @@ def analyze_repo(path: str | Path) -> LocalRepoStats:
 
     branches = list(repo.branches)
 
-    # Analyze commits
-    commits = list(repo.iter_commits())
-    total_commits = len(commits)
+    tip = repo.head.commit.hexsha if repo.head.is_valid() else None
+    use_cache = use_cache and not shallow
+    if use_cache and tip:
+        cached = _load_cached_stats(path, tip)
+        if cached:
+            # Branches can change without moving HEAD, so refresh them
+            return replace(
+                cached,
+                current_branch=current_branch,
+                total_branches=len(branches),
+            )
 
-    # Get contributor stats
+    # Stream the history once for contributors and the date range, without
+    # materializing Commit objects
     authors: Counter[str] = Counter()
-    for commit in commits:
-        authors[commit.author.name] += 1
-
-    contributors = authors.most_common()
-
-    # Get date range
     first_commit = None
     last_commit = None
-    if commits:
-        last_commit = commits[0].committed_datetime
-        first_commit = commits[-1].committed_datetime
 
-    # Calculate line changes (sample recent commits for performance)
+    if tip:
+        first_date = last_date = None
+        log_args = ("--format=%cI%x1f%an", *_since_args(shallow))
+        for line in _iter_git_lines(repo, "log", *log_args):
+            date, _, author = line.partition("\x1f")
+            authors[author] += 1
+            if last_date is None:
+                last_date = date
+            first_date = date
+
+        if last_date is not None:
+            last_commit = datetime.fromisoformat(last_date)
+            first_commit = datetime.fromisoformat(first_date)
+
+    total_commits = sum(authors.values())
+    contributors = authors.most_common()
+
+    # Calculate line changes (sample recent commits for performance); git
+    # stops after STATS_SAMPLE_SIZE commits instead of walking the history
     total_added = 0
     total_deleted = 0
-    sample_size = min(100, len(commits))
 
-    for commit in commits[:sample_size]:
-        try:
-            stats = commit.stats.total
-            total_added += stats.get("insertions", 0)
-            total_deleted += stats.get("deletions", 0)
-        except (GitCommandError, KeyError):
-            pass
+    for commit in _bulk_numstat(repo, STATS_SAMPLE_SIZE, shallow):
+        total_added += commit.insertions
+        total_deleted += commit.deletions
 
-    return LocalRepoStats(
+    stats = LocalRepoStats(
         path=str(path),
         name=path.name,
         current_branch=current_branch,
@@ -110,37 +271,26 @@ def analyze_repo(path: str | Path) -> LocalRepoStats:
         total_lines_deleted=total_deleted,
     )
 
+    if use_cache and tip:
+        _save_cached_stats(path, tip, stats)
+
+    return stats
+
 
 def get_recent_commits(
     path: str | Path,
     count: int = 10,
     author: str | None = None,
+    shallow: bool = False,
+    repo: Repo | None = None,
 ) -> list[CommitInfo]:
     """Get recent commits from a repository."""
-    repo = get_repo(path)
-    commits = []
-
-    for commit in repo.iter_commits(max_count=count):
-        if author and author.lower() not in commit.author.name.lower():
-            continue
+    if repo is None:
+        repo = get_repo(path)
+    commits = _bulk_numstat(repo, count, shallow)
 
-        try:
-            stats = commit.stats.total
-        except (GitCommandError, KeyError):
-            stats = {"files": 0, "insertions": 0, "deletions": 0}
-
-        commits.append(
-            CommitInfo(
-                sha=commit.hexsha[:7],
-                message=commit.message.strip().split("\n")[0][:72],
-                author=commit.author.name,
-                author_email=commit.author.email,
-                date=commit.committed_datetime,
-                files_changed=stats.get("files", 0),
-                insertions=stats.get("insertions", 0),
-                deletions=stats.get("deletions", 0),
-            )
-        )
+    if author:
+        commits = [c for c in commits if author.lower() in c.author.lower()]
 
     return commits
 
@@ -148,40 +298,50 @@ def get_recent_commits(
 def get_commit_frequency(
     path: str | Path,
     days: int = 30,
+    shallow: bool = False,
+    repo: Repo | None = None,
 ) -> dict[str, int]:
     """Get commit frequency by day of week."""
-    repo = get_repo(path)
-    frequency: dict[str, int] = {
-        "Monday": 0,
-        "Tuesday": 0,
-        "Wednesday": 0,
-        "Thursday": 0,
-        "Friday": 0,
-        "Saturday": 0,
-        "Sunday": 0,
-    }
-
-    cutoff = datetime.now(timezone.utc).timestamp() - (days * 24 * 60 * 60)
-
-    for commit in repo.iter_commits():
-        if commit.committed_date < cutoff:
-            break
-        day = commit.committed_datetime.strftime("%A")
-        frequency[day] += 1
+    if repo is None:
+        repo = get_repo(path)
+    frequency = dict.fromkeys(_DAYS, 0)
+
+    if not repo.head.is_valid():
+        return frequency
+
+    if shallow:
+        days = min(days, SHALLOW_DAYS)
+
+    # Let git stop the walk at the cutoff and emit the weekday as a number,
+    # which unlike %A does not depend on the locale
+    output = repo.git.log(
+        f"--since={days}.days.ago",
+        "--format=%cd",
+        "--date=format:%w",
+    )
+    for weekday in output.splitlines():
+        # %w counts from Sunday = 0, which index -1 maps onto
+        frequency[_DAYS[int(weekday) - 1]] += 1
 
     return frequency
 
 
-def get_file_types(path: str | Path) -> dict[str, int]:
+def get_file_types(path: str | Path, repo: Repo | None = None) -> dict[str, int]:
     """Get count of files by extension in the repository."""
-    repo = get_repo(path)
+    if repo is None:
+        repo = get_repo(path)
     extensions: Counter[str] = Counter()
 
     try:
-        for item in repo.head.commit.tree.traverse():
-            if item.type == "blob":
-                ext = Path(item.path).suffix or "(no extension)"
-                extensions[ext] += 1
+        # -z prints paths verbatim; without it git C-quotes names containing
+        # quotes, backslashes or control characters
+        for record in _iter_git_records(repo, "ls_tree", "-r", "-z", "HEAD"):
+            # "<mode> <type> <object>\t<path>"; skip submodules (type "commit")
+            info, _, file_path = record.partition("\t")
+            if info.split(" ", 2)[1] != "blob":
+                continue
+            ext = Path(file_path).suffix or "(no extension)"
+            extensions[ext] += 1
     except (GitCommandError, ValueError):
         pass
 
@@ -0,0 +1,26 @@
+"""Tests for CLI helpers."""
+
+from src.dev_stats_cli.cli import _print_simple_table
+
+
+class TestPrintSimpleTable:
+    def test_pads_columns(self, capsys):
+        _print_simple_table(
+            "Recent Commits (2)",
+            ["SHA", "Message", "Author"],
+            [
+                ("abc1234", "Fix bug", "Alice"),
+                ("def5678", "A longer message", "Bob"),
+            ],
+            ["yellow", "white", "cyan"],
+        )
+        assert capsys.readouterr().out.splitlines() == [
+            "Recent Commits (2)",
+            "SHA      Message           Author",
+            "abc1234  Fix bug           Alice",
+            "def5678  A longer message  Bob",
+        ]
+
+    def test_no_rows(self, capsys):
+        _print_simple_table("Empty", ["SHA", "Message"], [], ["yellow", "white"])
+        assert capsys.readouterr().out.splitlines() == ["Empty", "SHA  Message"]
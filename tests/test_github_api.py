@@ -1,15 +1,64 @@
 """Tests for GitHub API module."""
 
+import json
+
 import pytest
+from unittest.mock import MagicMock, patch
 
 from src.dev_stats_cli.github_api import (
+    TOP_LANGUAGES,
     RepoStats,
+    _parse_gh_ts,
     calculate_language_stats,
+    GitHubError,
     calculate_summary_stats,
+    get_user_overview,
+    get_user_repos,
 )
+from dataclasses import replace
 from datetime import datetime, timezone
 
 
+def make_repo_json(name, fork=False):
+    """Minimal repository payload as returned by the REST API."""
+    return {
+        "name": name,
+        "full_name": f"user/{name}",
+        "description": None,
+        "language": "Python",
+        "stargazers_count": 1,
+        "forks_count": 0,
+        "watchers_count": 1,
+        "open_issues_count": 0,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "fork": fork,
+        "size": 10,
+    }
+
+
+def make_response(data, last_page=None, status_code=200, etag=None):
+    """Fake requests.Response for a page of results."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(data).encode()
+    response.headers = {}
+    if last_page:
+        response.headers["Link"] = (
+            f'<https://api.github.com/user/1/repos?per_page=100&page={last_page}>; rel="last"'
+        )
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the response cache out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def sample_repos():
     """Sample repository data for testing."""
@@ -74,6 +123,16 @@ class TestCalculateLanguageStats:
         stats = calculate_language_stats([])
         assert stats == {}
 
+    def test_limited_to_top_languages(self, sample_repos):
+        repos = [
+            replace(sample_repos[0], language=f"Lang{i}")
+            for i in range(TOP_LANGUAGES + 5)
+        ]
+        repos += sample_repos
+        stats = calculate_language_stats(repos)
+        assert len(stats) == TOP_LANGUAGES
+        assert list(stats)[0] == "Python"
+
 
 class TestCalculateSummaryStats:
     def test_total_repos(self, sample_repos):
@@ -107,3 +166,164 @@ class TestCalculateSummaryStats:
         assert stats["total_stars"] == 0
         assert stats["average_stars"] == 0
         assert stats["top_language"] is None
+
+
+class TestParseTimestamp:
+    def test_utc_timestamp(self):
+        assert _parse_gh_ts("2024-01-02T03:04:05Z") == datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+        )
+
+
+class TestGetUserRepos:
+    def test_single_page(self):
+        pages = [make_response([make_repo_json("a"), make_repo_json("b", fork=True)])]
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.get.side_effect = pages
+            repos = get_user_repos("user")
+        assert [r.name for r in repos] == ["a"]
+        assert session.get.call_count == 1
+
+    def test_fetches_all_pages_in_order(self):
+        def fake_get(url, headers, params, timeout):
+            page = params["page"]
+            return make_response(
+                [make_repo_json(f"repo{page}")],
+                last_page=3 if page == 1 else None,
+            )
+
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.get.side_effect = fake_get
+            repos = get_user_repos("user")
+        assert [r.name for r in repos] == ["repo1", "repo2", "repo3"]
+        assert session.get.call_count == 3
+
+
+class TestResponseCache:
+    def test_revalidates_with_etag(self):
+        first = make_response([make_repo_json("a")], etag='"abc"')
+        not_modified = make_response(None, status_code=304)
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.get.side_effect = [first, not_modified]
+            assert [r.name for r in get_user_repos("user")] == ["a"]
+            assert [r.name for r in get_user_repos("user")] == ["a"]
+        assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+        assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_no_cache_skips_revalidation(self):
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.get.side_effect = [
+                make_response([make_repo_json("a")], etag='"abc"'),
+                make_response([make_repo_json("b")], etag='"def"'),
+            ]
+            get_user_repos("user")
+            repos = get_user_repos("user", use_cache=False)
+        assert [r.name for r in repos] == ["b"]
+        assert "If-None-Match" not in session.get.call_args_list[1].kwargs["headers"]
+
+
+def make_graphql_response(user):
+    """Fake requests.Response for a GraphQL user query."""
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps({"data": {"user": user}}).encode()
+    return response
+
+
+def make_graphql_user(repo_names, end_cursor=None):
+    """Minimal GraphQL user payload with one page of repositories."""
+    return {
+        "login": "user",
+        "name": "A User",
+        "bio": None,
+        "avatarUrl": None,
+        "createdAt": "2020-01-01T00:00:00Z",
+        "followers": {"totalCount": 10},
+        "following": {"totalCount": 2},
+        "publicRepos": {"totalCount": 3},
+        "repositories": {
+            "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+            "nodes": [
+                {
+                    "name": name,
+                    "nameWithOwner": f"user/{name}",
+                    "description": None,
+                    "primaryLanguage": {"name": "Go"},
+                    "stargazerCount": 4,
+                    "forkCount": 1,
+                    "issues": {"totalCount": 2},
+                    "pullRequests": {"totalCount": 1},
+                    "createdAt": "2021-01-01T00:00:00Z",
+                    "updatedAt": "2022-01-01T00:00:00Z",
+                    "isFork": False,
+                    "diskUsage": None,
+                }
+                for name in repo_names
+            ],
+        },
+    }
+
+
+def fake_rest_get(login):
+    """Fake session.get serving a REST profile and one page of repositories."""
+    user_json = {
+        "login": login,
+        "public_repos": 1,
+        "followers": 7,
+        "following": 0,
+        "created_at": "2020-01-01T00:00:00Z",
+    }
+
+    def fake_get(url, headers, params, timeout):
+        if url.endswith("/repos"):
+            return make_response([make_repo_json("a")])
+        return make_response(user_json)
+
+    return fake_get
+
+
+class TestGetUserOverview:
+    def test_graphql_with_token(self):
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.post.side_effect = [
+                make_graphql_response(make_graphql_user(["a", "b"], end_cursor="c1")),
+                make_graphql_response(make_graphql_user(["c"])),
+            ]
+            user, repos = get_user_overview("user", token="secret")
+
+        session.get.assert_not_called()
+        assert session.post.call_args_list[1].kwargs["json"]["variables"]["cursor"] == "c1"
+        assert user.followers == 10
+        assert user.public_repos == 3
+        assert [r.name for r in repos] == ["a", "b", "c"]
+        assert repos[0].language == "Go"
+        assert repos[0].open_issues == 3
+        assert repos[0].size_kb == 0
+
+    def test_graphql_unknown_user(self):
+        not_found = make_response(None, status_code=404)
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.post.return_value = make_graphql_response(None)
+            session.get.return_value = not_found
+            with pytest.raises(GitHubError, match="not found"):
+                get_user_overview("nobody", token="secret")
+
+    def test_organization_falls_back_to_rest(self):
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.post.return_value = make_graphql_response(None)
+            session.get.side_effect = fake_rest_get("acme")
+            user, repos = get_user_overview("acme", token="secret")
+
+        session.post.assert_called_once()
+        assert user.username == "acme"
+        assert user.followers == 7
+        assert [r.name for r in repos] == ["a"]
+
+    def test_rest_without_token(self):
+        with patch("src.dev_stats_cli.github_api._SESSION") as session:
+            session.get.side_effect = fake_rest_get("user")
+            user, repos = get_user_overview("user")
+
+        session.post.assert_not_called()
+        assert user.username == "user"
+        assert [r.name for r in repos] == ["a"]
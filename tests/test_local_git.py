@@ -1,18 +1,61 @@
 """Tests for local git module."""
 
+import os
+import subprocess
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from src.dev_stats_cli.local_git import (
     CommitInfo,
     LocalRepoStats,
     LocalGitError,
+    analyze_repo,
+    get_commit_frequency,
+    get_file_types,
+    get_recent_commits,
     get_repo,
 )
 
 
+def git(cwd, *args, author="Alice", date=None):
+    """Run a git command with a fixed identity."""
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+        "GIT_COMMITTER_NAME": author,
+        "GIT_COMMITTER_EMAIL": f"{author.lower()}@example.com",
+    }
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path_factory, monkeypatch):
+    """Keep the stats cache out of the user's home directory."""
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+    return path
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    """A small repository with commits from two authors."""
+    git(tmp_path, "init", "-b", "main")
+    (tmp_path / "app.py").write_text("a\nb\nc\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-m", "Add app")
+    (tmp_path / "app.py").write_text("a\nc\n")
+    (tmp_path / "README").write_text("hello\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-m", "Update app\n\nLonger body", author="Bob")
+    return tmp_path
+
+
 class TestGetRepo:
     def test_invalid_path(self, tmp_path):
         with pytest.raises(LocalGitError, match="Not a git repository"):
@@ -61,3 +104,184 @@ class TestLocalRepoStats:
         assert stats.name == "repo"
         assert stats.total_commits == 100
         assert len(stats.contributors) == 2
+
+
+class TestGetRecentCommits:
+    def test_line_stats(self, sample_repo):
+        commits = get_recent_commits(sample_repo)
+        assert [c.message for c in commits] == ["Update app", "Add app"]
+        latest = commits[0]
+        assert latest.author == "Bob"
+        assert latest.author_email == "bob@example.com"
+        assert latest.files_changed == 2
+        assert latest.insertions == 1
+        assert latest.deletions == 1
+        assert commits[1].insertions == 3
+
+    def test_merge_diffed_against_first_parent(self, sample_repo):
+        git(sample_repo, "checkout", "-b", "feature")
+        (sample_repo / "feature.py").write_text("x\ny\n")
+        git(sample_repo, "add", ".")
+        git(sample_repo, "commit", "-m", "Add feature")
+        git(sample_repo, "checkout", "main")
+        git(sample_repo, "merge", "--no-ff", "-m", "Merge feature", "feature")
+        commits = get_recent_commits(sample_repo)
+        assert [c.message for c in commits].count("Merge feature") == 1
+        merge = commits[0]
+        assert merge.files_changed == 1
+        assert merge.insertions == 2
+
+    def test_rename_counted_as_delete_and_add(self, sample_repo):
+        git(sample_repo, "mv", "app.py", "main.py")
+        git(sample_repo, "commit", "-m", "Rename app")
+        renamed = get_recent_commits(sample_repo, count=1)[0]
+        assert renamed.files_changed == 2
+        assert renamed.insertions == 2
+        assert renamed.deletions == 2
+
+    def test_empty_repo(self, tmp_path):
+        git(tmp_path, "init")
+        assert get_recent_commits(tmp_path) == []
+
+    def test_count(self, sample_repo):
+        assert len(get_recent_commits(sample_repo, count=1)) == 1
+
+    def test_reuses_given_repo(self, sample_repo):
+        repo = get_repo(sample_repo)
+        with patch("src.dev_stats_cli.local_git.get_repo") as mock_get_repo:
+            commits = get_recent_commits(sample_repo, repo=repo)
+        mock_get_repo.assert_not_called()
+        assert len(commits) == 2
+
+    def test_author_filter(self, sample_repo):
+        commits = get_recent_commits(sample_repo, author="alice")
+        assert [c.author for c in commits] == ["Alice"]
+
+
+class TestAnalyzeRepo:
+    def test_history(self, sample_repo):
+        stats = analyze_repo(sample_repo)
+        assert stats.current_branch == "main"
+        assert stats.total_commits == 2
+        assert sorted(stats.contributors) == [("Alice", 1), ("Bob", 1)]
+        assert stats.first_commit <= stats.last_commit
+        assert stats.total_lines_added == 4
+        assert stats.total_lines_deleted == 1
+
+    def test_line_stats_sample_size(self, sample_repo):
+        with patch("src.dev_stats_cli.local_git.STATS_SAMPLE_SIZE", 1):
+            stats = analyze_repo(sample_repo, use_cache=False)
+        assert stats.total_commits == 2
+        assert stats.total_lines_added == 1
+        assert stats.total_lines_deleted == 1
+
+    def test_reuses_cache_while_head_unchanged(self, sample_repo):
+        analyze_repo(sample_repo)
+        with patch("src.dev_stats_cli.local_git._bulk_numstat") as numstat:
+            stats = analyze_repo(sample_repo)
+        numstat.assert_not_called()
+        assert stats == analyze_repo(sample_repo, use_cache=False)
+
+    def test_cache_invalidated_by_new_commit(self, sample_repo):
+        assert analyze_repo(sample_repo).total_commits == 2
+        git(sample_repo, "commit", "--allow-empty", "-m", "Third")
+        assert analyze_repo(sample_repo).total_commits == 3
+
+    def test_shallow_skips_old_history(self, tmp_path):
+        git(tmp_path, "init")
+        git(tmp_path, "commit", "--allow-empty", "-m", "Old", date="2000-01-03T12:00:00+00:00")
+        git(tmp_path, "commit", "--allow-empty", "-m", "New")
+        assert analyze_repo(tmp_path).total_commits == 2
+        assert analyze_repo(tmp_path, shallow=True).total_commits == 1
+        assert [c.message for c in get_recent_commits(tmp_path, shallow=True)] == ["New"]
+
+    def test_shallow_results_not_cached(self, sample_repo, cache_home):
+        analyze_repo(sample_repo, shallow=True)
+        assert not (cache_home / "devstats" / "local").exists()
+        analyze_repo(sample_repo)
+        with patch("src.dev_stats_cli.local_git._bulk_numstat") as numstat:
+            numstat.return_value = []
+            analyze_repo(sample_repo, shallow=True)
+        numstat.assert_called_once()
+
+    def test_empty_repo(self, tmp_path):
+        git(tmp_path, "init")
+        stats = analyze_repo(tmp_path)
+        assert stats.total_commits == 0
+        assert stats.contributors == []
+        assert stats.first_commit is None
+        assert stats.last_commit is None
+
+
+class TestGetCommitFrequency:
+    def test_counts_recent_commits(self, sample_repo):
+        frequency = get_commit_frequency(sample_repo)
+        assert list(frequency) == [
+            "Monday",
+            "Tuesday",
+            "Wednesday",
+            "Thursday",
+            "Friday",
+            "Saturday",
+            "Sunday",
+        ]
+        assert sum(frequency.values()) == 2
+
+    def test_buckets_by_weekday(self, tmp_path):
+        git(tmp_path, "init")
+        now = datetime.now(timezone.utc)
+        dates = [now - timedelta(days=n) for n in (9, 3, 2)]
+        for date in dates:
+            git(tmp_path, "commit", "--allow-empty", "-m", "Work", date=date.isoformat())
+        frequency = get_commit_frequency(tmp_path)
+        # Nine and two days ago fall on the same weekday
+        assert frequency[dates[2].strftime("%A")] == 2
+        assert frequency[dates[1].strftime("%A")] == 1
+        assert sum(frequency.values()) == 3
+
+    def test_excludes_old_commits(self, tmp_path):
+        git(tmp_path, "init")
+        git(tmp_path, "commit", "--allow-empty", "-m", "old", date="2000-01-03T12:00:00+00:00")
+        assert sum(get_commit_frequency(tmp_path).values()) == 0
+
+
+class TestGetFileTypes:
+    def test_counts_extensions(self, sample_repo):
+        (sample_repo / "docs").mkdir()
+        (sample_repo / "docs" / "guide.md").write_text("guide\n")
+        (sample_repo / "docs" / "caf\u00e9.md").write_text("menu\n")
+        git(sample_repo, "add", ".")
+        git(sample_repo, "commit", "-m", "Add docs")
+        assert get_file_types(sample_repo) == {
+            ".md": 2,
+            ".py": 1,
+            "(no extension)": 1,
+        }
+
+    def test_paths_needing_quotes(self, sample_repo):
+        (sample_repo / 'say "hi".py').write_text("print()\n")
+        (sample_repo / "tab\tx.md").write_text("tab\n")
+        (sample_repo / "back\\slash.md").write_text("slash\n")
+        git(sample_repo, "add", ".")
+        git(sample_repo, "commit", "-m", "Add oddly named files")
+        assert get_file_types(sample_repo) == {
+            ".py": 2,
+            ".md": 2,
+            "(no extension)": 1,
+        }
+
+    def test_ignores_submodules(self, sample_repo):
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=sample_repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        git(sample_repo, "update-index", "--add", "--cacheinfo", f"160000,{head},vendor")
+        git(sample_repo, "commit", "-m", "Add submodule")
+        assert get_file_types(sample_repo) == {".py": 1, "(no extension)": 1}
+
+    def test_empty_repo(self, tmp_path):
+        git(tmp_path, "init")
+        assert get_file_types(tmp_path) == {}